@@ -1,16 +1,21 @@
 #!/usr/bin/env python3
 import csv
+import io
 import json
+import math
+import os
 import re
 import sys
 import time
-from collections import deque
-from dataclasses import dataclass, asdict
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict
+from typing import Optional, List, Tuple, Dict, Iterable, Callable
 
-from PySide6.QtCore import Qt, QProcess, QTimer
-from PySide6.QtGui import QFont, QPixmap, QColor, QPainter, QPainterPath
+from PySide6.QtCore import (
+    Qt, QAbstractTableModel, QModelIndex, QObject, QProcess, QRunnable, QThreadPool, QTimer, Signal,
+)
+from PySide6.QtGui import QFont, QPixmap, QPixmapCache, QColor, QPainter, QPainterPath
 from PySide6.QtWidgets import (
     QApplication,
     QButtonGroup,
@@ -32,8 +37,7 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QSpinBox,
     QTabWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -76,14 +80,14 @@ def resolve_resource(name: str) -> str:
 # Data models
 # ----------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BlackFrameHit:
     frame: int
     time_s: Optional[float]
     pblack: Optional[float]
     pts: Optional[int]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BlackRange:
     start_frame: int
     end_frame: int
@@ -93,23 +97,211 @@ class BlackRange:
     avg_pblack: Optional[float]
     min_pblack: Optional[float]
 
-# Robust-ish parse for blackframe lines. Example:
+# AV_NOPTS_VALUE; stands in for a missing pts in HitsBuffer.pts
+NO_PTS = -(2 ** 63)
+
+@dataclass
+class HitsBuffer:
+    """
+    One file's hits stored column-wise (structure of arrays): four typed
+    arrays at ~32 bytes per hit instead of a BlackFrameHit object each.
+    Missing values are stored as NaN (time_s, pblack) or NO_PTS (pts);
+    indexing/iterating hands back BlackFrameHit records with None restored.
+    """
+    frame: array = field(default_factory=lambda: array("q"))
+    time_s: array = field(default_factory=lambda: array("d"))
+    pblack: array = field(default_factory=lambda: array("d"))
+    pts: array = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __getitem__(self, i: int) -> BlackFrameHit:
+        return self._hit(self.frame[i], self.time_s[i], self.pblack[i], self.pts[i])
+
+    def __iter__(self):
+        return map(self._hit, self.frame, self.time_s, self.pblack, self.pts)
+
+    @staticmethod
+    def _hit(frame: int, time_s: float, pblack: float, pts: int) -> BlackFrameHit:
+        return BlackFrameHit(
+            frame=frame,
+            time_s=None if math.isnan(time_s) else time_s,
+            pblack=None if math.isnan(pblack) else pblack,
+            pts=None if pts == NO_PTS else pts,
+        )
+
+    def append(self, hit: BlackFrameHit):
+        self.frame.append(hit.frame)
+        self.time_s.append(math.nan if hit.time_s is None else hit.time_s)
+        self.pblack.append(math.nan if hit.pblack is None else hit.pblack)
+        self.pts.append(NO_PTS if hit.pts is None else hit.pts)
+
+    def extend(self, other: "HitsBuffer", start: int = 0, end: Optional[int] = None):
+        """Append other[start:end]; array slices copy at C speed."""
+        self.frame.extend(other.frame[start:end])
+        self.time_s.extend(other.time_s[start:end])
+        self.pblack.extend(other.pblack[start:end])
+        self.pts.extend(other.pts[start:end])
+
+    def sort_by_frame(self):
+        order = sorted(range(len(self.frame)), key=self.frame.__getitem__)
+        for name in ("frame", "time_s", "pblack", "pts"):
+            column = getattr(self, name)
+            setattr(self, name, array(column.typecode, [column[i] for i in order]))
+
+@dataclass
+class RunTracker:
+    """
+    Splits one file's hits into runs of consecutive frames while they stream
+    in, O(1) per hit. Ranges then come straight from the HitsBuffer columns
+    at the end instead of a second pass over BlackFrameHit objects.
+    """
+    starts: array = field(default_factory=lambda: array("q"))  # index of each run's first hit
+    scanned: int = 0  # hits[:scanned] are assigned to runs
+    next_frame: int = 0  # frame number that would extend the open run
+    in_order: bool = True  # False once a hit arrives with a lower frame than its predecessor
+
+    def feed(self, hits: HitsBuffer):
+        """Assign hits appended since the last call to runs."""
+        frames = hits.frame
+        start = self.scanned
+        if start >= len(frames):
+            return
+        starts = self.starts
+        if not starts:
+            starts.append(start)
+            self.next_frame = frames[start] + 1
+            start += 1
+        expected = self.next_frame
+        for i in range(start, len(frames)):
+            frame = frames[i]
+            if frame != expected:
+                if frame < expected - 1:
+                    self.in_order = False
+                starts.append(i)
+            expected = frame + 1
+        self.next_frame = expected
+        self.scanned = len(frames)
+
+    def ranges(self, hits: HitsBuffer, min_run_frames: int) -> List[BlackRange]:
+        """Same result as build_ranges() for hits fed in frame order."""
+        frames, times, pblacks = hits.frame, hits.time_s, hits.pblack
+        bounds = list(self.starts)
+        bounds.append(len(frames))
+        ranges: List[BlackRange] = []
+        for start, end in zip(bounds, bounds[1:]):
+            length = frames[end - 1] - frames[start] + 1
+            if length < min_run_frames:
+                continue
+            pvals = [p for p in pblacks[start:end] if not math.isnan(p)]
+            start_t = times[start]
+            end_t = times[end - 1]
+            ranges.append(BlackRange(
+                start_frame=frames[start],
+                end_frame=frames[end - 1],
+                start_time_s=None if math.isnan(start_t) else start_t,
+                end_time_s=None if math.isnan(end_t) else end_t,
+                length_frames=length,
+                avg_pblack=sum(pvals) / len(pvals) if pvals else None,
+                min_pblack=min(pvals) if pvals else None,
+            ))
+        return ranges
+
+@dataclass
+class FileJob:
+    """Per-file analysis state: one ffmpeg process and its parse buffers."""
+    path: str
+    index: int  # position in the queue / file list
+    stage: str = "Analyzing"
+    ffmpeg_proc: Optional[QProcess] = None
+    stderr_buf: bytearray = field(default_factory=bytearray)
+    stdout_buf: bytearray = field(default_factory=bytearray)
+    header_done: bool = False  # input banner (Duration line) seen
+    duration_s: Optional[float] = None
+    frac: float = 0.0  # progress through this file, 0..1
+    hits: HitsBuffer = field(default_factory=HitsBuffer)
+    flushed: int = 0  # hits[:flushed] are already in the frames table
+    runs: RunTracker = field(default_factory=RunTracker)
+
+# Every blackframe log line starts with this filter tag
+BLACKFRAME_MARKER = b"[Parsed_blackframe"
+
+# Blackframe lines have a fixed layout (bytes, straight from ffmpeg stderr):
 # [Parsed_blackframe_0 @ ...] frame:23 pblack:100 pts:27600 t:0.920000 type:I last_keyframe:0
-BLACKFRAME_LINE_RE = re.compile(
-    r"Parsed_blackframe.*?\bframe:(?P<frame>\d+)"
-    r"(?:.*?\bpblack:(?P<pblack>\d+(?:\.\d+)?))?"
-    r"(?:.*?\bpts:(?P<pts>\d+))?"
-    r"(?:.*?\bt:(?P<t>\d+(?:\.\d+)?))?"
+# pts/t are negative (pts=NOPTS, t=-1) when the frame has no timestamp.
+# Matched over a whole block of lines at once, so the per-line scanning runs in C.
+BLACKFRAME_SCAN_RE = re.compile(
+    rb"^\[Parsed_blackframe[^\n]*?\] frame:(\d+) pblack:(\S+) pts:(\S+) t:(\S+)", re.MULTILINE
 )
 
-# ffmpeg -progress key=val lines
-PROGRESS_OUT_TIME_MS_RE = re.compile(r"^out_time_ms=(\d+)\s*$")
-PROGRESS_END_RE = re.compile(r"^progress=end\s*$")
 
-VIDEO_EXTENSIONS = {
+def scan_blackframe_hits(block: bytes, hits: HitsBuffer):
+    """
+    Append every blackframe hit in a block of complete ffmpeg stderr lines
+    to hits. Fields go straight into the HitsBuffer columns; other ffmpeg
+    output and malformed lines are skipped.
+    """
+    append_frame = hits.frame.append
+    append_time = hits.time_s.append
+    append_pblack = hits.pblack.append
+    append_pts = hits.pts.append
+    for frame, pblack, pts, t in BLACKFRAME_SCAN_RE.findall(block):
+        try:
+            frame = int(frame)
+            pblack = float(pblack)
+            pts = int(pts)
+            t = float(t)
+        except ValueError:
+            continue
+        append_frame(frame)
+        append_pblack(pblack)
+        if pts < 0:
+            append_time(math.nan)
+            append_pts(NO_PTS)
+        else:
+            append_time(t)
+            append_pts(pts)
+
+
+def parse_duration_line(line: bytes) -> Optional[float]:
+    """
+    Duration in seconds from ffmpeg's input banner, which is printed to
+    stderr before analysis starts. Example:
+      Duration: 00:01:23.45, start: 0.000000, bitrate: 1234 kb/s
+    Returns None for "Duration: N/A" (e.g. raw streams).
+    """
+    _, _, value = line.partition(b"Duration:")
+    value = value.split(b",", 1)[0].strip()
+    try:
+        hours, minutes, seconds = value.split(b":")
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+    except ValueError:
+        return None
+
+# Results-table flush timer: starting interval, adaptive bounds and rows per job per tick
+FLUSH_INTERVAL_MS = 150
+FLUSH_INTERVAL_MIN_MS = 50
+FLUSH_INTERVAL_MAX_MS = 500
+FLUSH_BATCH_SIZE = 500
+
+# How often running ffmpeg processes have their stdout/stderr read
+DRAIN_INTERVAL_MS = 50
+
+# Write buffer for export files
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Progress bar repaint cap and ETA throughput smoothing (weight of the newest sample)
+PROGRESS_UPDATE_HZ = 2
+ETA_SMOOTHING = 0.3
+
+# Fast mode: downscale before blackframe (nearest-neighbour; black stays black)
+FAST_MODE_SCALE = "scale=320:-2:flags=neighbor"
+
+VIDEO_EXTENSIONS = frozenset({
     ".mp4", ".mov", ".mkv", ".m4v", ".avi", ".mts", ".m2ts",
     ".webm", ".wmv", ".flv", ".ts", ".vob", ".mpg", ".mpeg",
-}
+})
 
 # Change 5: Module-level button stylesheet constants
 _START_BTN_STYLE = """
@@ -149,67 +341,76 @@ _CANCEL_BTN_STYLE = """
     }
 """
 
+# "hh:mm:ss" prefixes keyed by whole second. Hits cluster in black runs, so
+# consecutive timestamps share a prefix and only the milliseconds change.
+# Cleared at the start of each run to keep it bounded.
+_HHMMSS_CACHE: Dict[int, str] = {}
+
 # Change 11: Simplified — no timedelta needed
 def seconds_to_hhmmssms(seconds: Optional[float]) -> str:
     if seconds is None:
         return "n/a"
-    ms = int(round(seconds * 1000.0))
-    total_seconds = ms // 1000
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    secs = total_seconds % 60
-    msec = ms % 1000
-    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{msec:03d}"
+    total_seconds, msec = divmod(int(round(seconds * 1000.0)), 1000)
+    prefix = _HHMMSS_CACHE.get(total_seconds)
+    if prefix is None:
+        hours = total_seconds // 3600
+        minutes = (total_seconds % 3600) // 60
+        secs = total_seconds % 60
+        prefix = _HHMMSS_CACHE[total_seconds] = "%02d:%02d:%02d" % (hours, minutes, secs)
+    return f"{prefix}.{msec:03d}"
 
 # ----------------------------
 # Range building
 # ----------------------------
 
-def build_ranges(hits: List[BlackFrameHit], min_run_frames: int) -> List[BlackRange]:
-    if not hits:
+def build_ranges(hits: Iterable[BlackFrameHit], min_run_frames: int,
+                 assume_sorted: bool = True) -> List[BlackRange]:
+    """
+    Group consecutive frame numbers into ranges. ffmpeg emits blackframe
+    lines in frame order, so by default the hits are taken as already
+    sorted; pass assume_sorted=False for input in arbitrary order.
+    """
+    if assume_sorted:
+        hits_sorted = hits if isinstance(hits, list) else list(hits)
+    else:
+        hits_sorted = sorted(hits, key=lambda h: h.frame)
+    if not hits_sorted:
         return []
 
-    hits_sorted = sorted(hits, key=lambda h: h.frame)
-
     ranges: List[BlackRange] = []
-    cur = [hits_sorted[0]]
 
-    def finalize(group: List[BlackFrameHit]) -> Optional[BlackRange]:
-        if not group:
-            return None
-        start = group[0]
-        end = group[-1]
-        length = end.frame - start.frame + 1
+    def finalize(start: int, end: int):
+        # Run is hits_sorted[start:end]; stats come from C-level sum()/min()
+        first = hits_sorted[start]
+        last = hits_sorted[end - 1]
+        length = last.frame - first.frame + 1
         if length < min_run_frames:
-            return None
+            return
 
-        pvals = [h.pblack for h in group if h.pblack is not None]
+        pvals = [h.pblack for h in hits_sorted[start:end] if h.pblack is not None]
         avg_pb = sum(pvals) / len(pvals) if pvals else None
         min_pb = min(pvals) if pvals else None
 
-        return BlackRange(
-            start_frame=start.frame,
-            end_frame=end.frame,
-            start_time_s=start.time_s,
-            end_time_s=end.time_s,
+        ranges.append(BlackRange(
+            start_frame=first.frame,
+            end_frame=last.frame,
+            start_time_s=first.time_s,
+            end_time_s=last.time_s,
             length_frames=length,
             avg_pblack=avg_pb,
             min_pblack=min_pb,
-        )
-
-    for h in hits_sorted[1:]:
-        prev = cur[-1]
-        if h.frame == prev.frame + 1:
-            cur.append(h)
-        else:
-            r = finalize(cur)
-            if r:
-                ranges.append(r)
-            cur = [h]
-
-    r = finalize(cur)
-    if r:
-        ranges.append(r)
+        ))
+
+    # Track run boundaries by index instead of growing a list per run
+    start = 0
+    expected = hits_sorted[0].frame + 1
+    for i, h in enumerate(hits_sorted):
+        frame = h.frame
+        if frame != expected and i:
+            finalize(start, i)
+            start = i
+        expected = frame + 1
+    finalize(start, len(hits_sorted))
 
     return ranges
 
@@ -226,16 +427,26 @@ def collect_video_files(paths: List[str]) -> List[str]:
     result: List[str] = []
 
     for p in paths:
-        path = Path(p)
-        if path.is_dir():
-            for child in sorted(path.rglob("*")):
-                if child.is_file() and child.suffix.lower() in VIDEO_EXTENSIONS:
-                    resolved = str(child.resolve())
-                    if resolved not in seen:
-                        seen.add(resolved)
-                        result.append(resolved)
-        elif path.is_file() and path.suffix.lower() in VIDEO_EXTENSIONS:
-            resolved = str(path.resolve())
+        if os.path.isdir(p):
+            # os.walk filters on plain names from scandir; no Path object or
+            # stat() per entry for the (usually many) non-video siblings
+            candidates = [
+                os.path.join(root, name)
+                for root, _dirs, files in os.walk(p)
+                for name in files
+                if os.path.splitext(name)[1].lower() in VIDEO_EXTENSIONS
+            ]
+            # Component-wise, like sorted(Path.rglob("*"))
+            candidates.sort(key=lambda c: c.split(os.sep))
+        elif os.path.splitext(p)[1].lower() in VIDEO_EXTENSIONS:
+            candidates = [p]
+        else:
+            continue
+
+        for candidate in candidates:
+            if not os.path.isfile(candidate):
+                continue
+            resolved = os.path.realpath(candidate)
             if resolved not in seen:
                 seen.add(resolved)
                 result.append(resolved)
@@ -247,13 +458,24 @@ def collect_video_files(paths: List[str]) -> List[str]:
 # ----------------------------
 
 # Change 6: Cache scaled pixmap
+# Loaded on first use (QPixmap needs a QApplication) and shared by every banner
+_BANNER_PIXMAP: Optional[QPixmap] = None
+
+
+def _banner_pixmap() -> QPixmap:
+    global _BANNER_PIXMAP
+    if _BANNER_PIXMAP is None:
+        img_path = resolve_resource("logo2.png")
+        _BANNER_PIXMAP = QPixmap(img_path) if Path(img_path).exists() else QPixmap()
+    return _BANNER_PIXMAP
+
+
 class BannerWidget(QFrame):
     """Header banner that paints logo2.png as a scaled background image."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        img_path = resolve_resource("logo2.png")
-        self._bg = QPixmap(img_path) if Path(img_path).exists() else QPixmap()
+        self._bg = _banner_pixmap()
         self._aspect = self._bg.width() / max(self._bg.height(), 1) if not self._bg.isNull() else 4.0
         self._scaled_bg: Optional[QPixmap] = None
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
@@ -261,14 +483,25 @@ class BannerWidget(QFrame):
     def resizeEvent(self, event):
         # Set height to show the full image without cropping
         h = max(int(self.width() / self._aspect), 120)
-        self.setFixedHeight(h)
-        # Cache the scaled pixmap for paintEvent
-        if not self._bg.isNull():
-            self._scaled_bg = self._bg.scaledToWidth(self.width(), Qt.SmoothTransformation)
-        else:
-            self._scaled_bg = None
+        # setFixedHeight triggers another layout pass; only call it on a real change
+        if h != self.height():
+            self.setFixedHeight(h)
+        # Height-only resize events keep the width, so the scaled pixmap is still valid
+        if self._scaled_bg is None or self._scaled_bg.width() != self.width():
+            self._scaled_bg = self._scaled_to_width(self.width())
         super().resizeEvent(event)
 
+    def _scaled_to_width(self, width: int) -> Optional[QPixmap]:
+        if self._bg.isNull():
+            return None
+        # Scaled copies are keyed by width in Qt's pixmap cache
+        key = f"banner_{width}"
+        scaled = QPixmapCache.find(key)
+        if scaled is None:
+            scaled = self._bg.scaledToWidth(width, Qt.SmoothTransformation)
+            QPixmapCache.insert(key, scaled)
+        return scaled
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.SmoothPixmapTransform)
@@ -284,6 +517,166 @@ class BannerWidget(QFrame):
         painter.end()
 
 
+# ----------------------------
+# Results table models
+# ----------------------------
+
+class _ResultsModel(QAbstractTableModel):
+    """
+    Read-only table model. Cells are formatted on demand in data(), so only
+    the rows in the viewport cost anything.
+    """
+
+    HEADERS: List[str] = []
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cell_text(index.row(), index.column())
+
+    def _cell_text(self, row: int, column: int) -> str:
+        raise NotImplementedError
+
+
+class HitsModel(_ResultsModel):
+    """Frames table over a HitsBuffer plus a per-row index into file names."""
+
+    HEADERS = ["File", "Frame Number", "Timestamp", "Blackness %"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._names: List[str] = []
+        self._name_index = array("I")
+        self._hits = HitsBuffer()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._hits)
+
+    def _cell_text(self, row: int, column: int) -> str:
+        # Read the one column this cell needs; no BlackFrameHit per cell
+        if column == 0:
+            return self._names[self._name_index[row]]
+        if column == 1:
+            return str(self._hits.frame[row])
+        if column == 2:
+            t = self._hits.time_s[row]
+            return seconds_to_hhmmssms(None if math.isnan(t) else t)
+        p = self._hits.pblack[row]
+        return "n/a" if math.isnan(p) else f"{p:.2f}%"
+
+    def _extend(self, filename: str, hits: HitsBuffer, start: int, end: int):
+        if not self._names or self._names[-1] != filename:
+            self._names.append(filename)
+        self._name_index.extend(array("I", [len(self._names) - 1]) * (end - start))
+        self._hits.extend(hits, start, end)
+
+    def append_hits(self, filename: str, hits: HitsBuffer, start: int, end: int):
+        if end <= start:
+            return
+        first = len(self._hits)
+        self.beginInsertRows(QModelIndex(), first, first + end - start - 1)
+        self._extend(filename, hits, start, end)
+        self.endInsertRows()
+
+    def set_files(self, files: List[Tuple[str, HitsBuffer]]):
+        self.beginResetModel()
+        self._names = []
+        self._name_index = array("I")
+        self._hits = HitsBuffer()
+        for filename, hits in files:
+            if len(hits):
+                self._extend(filename, hits, 0, len(hits))
+        self.endResetModel()
+
+    def clear(self):
+        self.set_files([])
+
+
+class RangesModel(_ResultsModel):
+    """Ranges table over (filename, BlackRange) rows; ranges are few."""
+
+    HEADERS = ["File", "Start Frame", "End Frame", "Start Time", "End Time", "Length", "Avg / Min %"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, BlackRange]] = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def _cell_text(self, row: int, column: int) -> str:
+        filename, r = self._rows[row]
+        if column == 0:
+            return filename
+        if column == 1:
+            return str(r.start_frame)
+        if column == 2:
+            return str(r.end_frame)
+        if column == 3:
+            return seconds_to_hhmmssms(r.start_time_s)
+        if column == 4:
+            return seconds_to_hhmmssms(r.end_time_s)
+        if column == 5:
+            return str(r.length_frames)
+        if r.avg_pblack is not None and r.min_pblack is not None:
+            return f"{r.avg_pblack:.2f}% / {r.min_pblack:.2f}%"
+        if r.min_pblack is not None:
+            return f"n/a / {r.min_pblack:.2f}%"
+        return "n/a"
+
+    def set_rows(self, rows: List[Tuple[str, BlackRange]]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def clear(self):
+        self.set_rows([])
+
+
+# ----------------------------
+# Background JSON export
+# ----------------------------
+
+class _ExportSignals(QObject):
+    # (task, error message; "" on success)
+    finished = Signal(object, str)
+
+
+class JsonExportTask(QRunnable):
+    """
+    Builds a JSON export payload and writes it on a QThreadPool thread so
+    large result sets don't freeze the window. build_payload must only read
+    data the GUI thread no longer mutates.
+    """
+
+    def __init__(self, path: str, build_payload: Callable[[], list], button: QPushButton):
+        super().__init__()
+        self.setAutoDelete(False)  # the window holds the reference until finished
+        self.path = path
+        self.build_payload = build_payload
+        self.button = button
+        self.signals = _ExportSignals()
+
+    def run(self):
+        try:
+            payload = self.build_payload()
+            with open(self.path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+                # One dumps() + write is faster than dump()'s stream of small writes
+                f.write(json.dumps(payload, indent=2))
+        except OSError as e:
+            self.signals.finished.emit(self, str(e))
+            return
+        self.signals.finished.emit(self, "")
+
+
 # ----------------------------
 # Main Window
 # ----------------------------
@@ -294,42 +687,41 @@ class BlackFrameDetectorV2(QMainWindow):
         self.setWindowTitle("Black Frame Detector")
         self.resize(1040, 820)
 
-        # Processes
-        self.probe_proc: Optional[QProcess] = None
-        self.ffmpeg_proc: Optional[QProcess] = None
-
-        # Parse buffers (line-safe)
-        self._stderr_buf = ""
-        self._stdout_buf = ""
-
-        # Metadata
-        self.video_duration_s: Optional[float] = None
-        self.video_fps: Optional[float] = None
+        # Worker pool: files are independent, so several run side by side
+        self._workers: Dict[str, FileJob] = {}
+        self._max_parallel = max(1, (os.cpu_count() or 2) // 2)
 
         # Run state
         self._running = False
-        self._analysis_start_time: Optional[float] = None
-        self._queue_start_time: Optional[float] = None
+        self._queue_start_time: Optional[float] = None  # time.monotonic()
+        self._last_progress_update = 0.0
+        self._eta_rate: Optional[float] = None  # smoothed queue fraction per second
+        self._eta_sample: Tuple[float, float] = (0.0, 0.0)  # (time, frac) behind _eta_rate
         self._total_video_duration_s: float = 0.0
 
-        # Per-file scratch results
-        self.hits: List[BlackFrameHit] = []
-        self.ranges: List[BlackRange] = []
-        # Change 9: deque for O(1) popleft
-        self._pending_hits: deque[BlackFrameHit] = deque()
-
         # Multi-file queue
         self._file_queue: List[str] = []
-        self._current_queue_index: int = 0
+        self._next_queue_index: int = 0
+        self._finished_count: int = 0
         self._queue_active: bool = False
-        self.all_hits: Dict[str, List[BlackFrameHit]] = {}
+        self.all_hits: Dict[str, HitsBuffer] = {}
         self.all_ranges: Dict[str, List[BlackRange]] = {}
+        # Running totals over all_hits / all_ranges, kept as files finish
+        self._total_frame_count = 0
+        self._total_range_count = 0
+        self._name_cache: Dict[str, str] = {}  # queued path -> display file name
+        self._export_tasks: List[JsonExportTask] = []  # JSON exports still being written
 
         # UI batch flush timer
         self.flush_timer = QTimer(self)
-        self.flush_timer.setInterval(150)
+        self.flush_timer.setInterval(FLUSH_INTERVAL_MS)
         self.flush_timer.timeout.connect(self._flush_pending_hits)
 
+        # ffmpeg pipe drain timer: one pass over every worker instead of a signal per chunk
+        self.drain_timer = QTimer(self)
+        self.drain_timer.setInterval(DRAIN_INTERVAL_MS)
+        self.drain_timer.timeout.connect(self._drain_ffmpeg_output)
+
         self._build_ui()
 
         # Defaults (macOS + practical black detection for various codecs)
@@ -338,6 +730,7 @@ class BlackFrameDetectorV2(QMainWindow):
         self.amount_spin.setValue(98.00)
         self.group_ranges_checkbox.setChecked(True)
         self.min_run_spin.setValue(1)  # detect single black frames by default
+        self.parallel_spin.setValue(self._max_parallel)
 
         self._sync_mode_presets()
         self._update_range_controls_enabled()
@@ -507,6 +900,20 @@ class BlackFrameDetectorV2(QMainWindow):
         min_run_hint = QLabel("Use ranges to avoid thousands of single-frame entries; ideal for leaders/tails/slates.")
         min_run_hint.setStyleSheet("color: #6b6b6b;")
 
+        # Speed
+        speed_label = QLabel("Speed:")
+        self.fast_mode_checkbox = QCheckBox("Fast mode")
+        fast_mode_hint = QLabel("Analyzes a 320 px wide copy of every frame. Much faster on HD/4K; Blackness % may differ slightly.")
+        fast_mode_hint.setStyleSheet("color: #6b6b6b;")
+
+        parallel_label = QLabel("Parallel Analyses:")
+        self.parallel_spin = QSpinBox()
+        self.parallel_spin.setRange(1, max(1, os.cpu_count() or 1))
+        self.parallel_spin.setSingleStep(1)
+        self.parallel_spin.setSuffix(" files")
+        parallel_hint = QLabel("Files analyzed at the same time; CPU cores are shared between them.")
+        parallel_hint.setStyleSheet("color: #6b6b6b;")
+
         # Layout
         grid.addWidget(mode_label, 0, 0, Qt.AlignRight)
         grid.addLayout(mode_row, 0, 1)
@@ -527,25 +934,23 @@ class BlackFrameDetectorV2(QMainWindow):
         grid.addWidget(self.min_run_spin, 7, 1, Qt.AlignLeft)
         grid.addWidget(min_run_hint, 8, 1, 1, 2)
 
+        grid.addWidget(speed_label, 9, 0, Qt.AlignRight)
+        grid.addWidget(self.fast_mode_checkbox, 9, 1, Qt.AlignLeft)
+        grid.addWidget(fast_mode_hint, 10, 1, 1, 2)
+
+        grid.addWidget(parallel_label, 11, 0, Qt.AlignRight)
+        grid.addWidget(self.parallel_spin, 11, 1, Qt.AlignLeft)
+        grid.addWidget(parallel_hint, 12, 1, 1, 2)
+
         return settings_box
 
     def _build_results_section(self) -> Tuple[QTabWidget, QHBoxLayout]:
         self.tabs = QTabWidget()
-        self.frames_table = QTableWidget(0, 4)
-        self.frames_table.setHorizontalHeaderLabels(["File", "Frame Number", "Timestamp", "Blackness %"])
-        self.frames_table.horizontalHeader().setStretchLastSection(True)
-        self.frames_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.frames_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.frames_table.setAlternatingRowColors(True)
-        self.frames_table.setStyleSheet("QTableWidget { background-color: #000000; color: white; } QTableWidget::item:alternate { background-color: #0a0a0a; }")
-
-        self.ranges_table = QTableWidget(0, 7)
-        self.ranges_table.setHorizontalHeaderLabels(["File", "Start Frame", "End Frame", "Start Time", "End Time", "Length", "Avg / Min %"])
-        self.ranges_table.horizontalHeader().setStretchLastSection(True)
-        self.ranges_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.ranges_table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.ranges_table.setAlternatingRowColors(True)
-        self.ranges_table.setStyleSheet("QTableWidget { background-color: #000000; color: white; } QTableWidget::item:alternate { background-color: #0a0a0a; }")
+        self.frames_model = HitsModel(self)
+        self.frames_table = self._make_results_view(self.frames_model)
+
+        self.ranges_model = RangesModel(self)
+        self.ranges_table = self._make_results_view(self.ranges_model)
 
         self.tabs.addTab(self.ranges_table, "Ranges")
         self.tabs.addTab(self.frames_table, "Frames")
@@ -581,6 +986,16 @@ class BlackFrameDetectorV2(QMainWindow):
             # Indeterminate/busy bar
             self.progress.setRange(0, 0)
 
+    def _make_results_view(self, model: _ResultsModel) -> QTableView:
+        view = QTableView()
+        view.setModel(model)
+        view.horizontalHeader().setStretchLastSection(True)
+        view.setSelectionBehavior(QTableView.SelectRows)
+        view.setEditTriggers(QTableView.NoEditTriggers)
+        view.setAlternatingRowColors(True)
+        view.setStyleSheet("QTableView { background-color: #000000; color: white; } QTableView::item:alternate { background-color: #0a0a0a; }")
+        return view
+
     def _update_range_controls_enabled(self):
         enabled = self.group_ranges_checkbox.isChecked()
         self.min_run_spin.setEnabled(enabled)
@@ -703,18 +1118,21 @@ class BlackFrameDetectorV2(QMainWindow):
 
         # Global reset
         self._file_queue = queue
-        self._current_queue_index = 0
+        self._max_parallel = int(self.parallel_spin.value())
+        # Display names are needed per flush, status line, table render and export
+        self._name_cache = {p: Path(p).name for p in queue}
+        self._next_queue_index = 0
+        self._finished_count = 0
         self._queue_active = True
+        self._workers.clear()
         self.all_hits.clear()
         self.all_ranges.clear()
-        self.hits.clear()
-        self.ranges.clear()
-        self._pending_hits.clear()
-        self._stderr_buf = ""
-        self._stdout_buf = ""
+        self._total_frame_count = 0
+        self._total_range_count = 0
+        _HHMMSS_CACHE.clear()
 
-        self.frames_table.setRowCount(0)
-        self.ranges_table.setRowCount(0)
+        self.frames_model.clear()
+        self.ranges_model.clear()
 
         for b in [self.export_frames_csv_btn, self.export_frames_json_btn,
                    self.export_ranges_csv_btn, self.export_ranges_json_btn]:
@@ -731,47 +1149,50 @@ class BlackFrameDetectorV2(QMainWindow):
             item.setText(Path(item.data(Qt.UserRole)).name)
             item.setForeground(QColor("white"))
 
-        self._queue_start_time = time.time()
+        self._queue_start_time = time.monotonic()
+        self._last_progress_update = 0.0
+        self._eta_rate = None
         self._total_video_duration_s = 0.0
+        self.flush_timer.setInterval(FLUSH_INTERVAL_MS)
         self._set_running_ui(True)
-        self._start_next_file()
+        self._fill_workers()
+
+    def _fill_workers(self):
+        """Start queued files until the worker pool is full."""
+        while (self._queue_active and len(self._workers) < self._max_parallel
+               and self._next_queue_index < len(self._file_queue)):
+            index = self._next_queue_index
+            self._next_queue_index += 1
+            self._start_file(index)
 
-    def _start_next_file(self):
-        if self._current_queue_index >= len(self._file_queue):
+        if not self._workers:
             self._on_all_files_finished()
-            return
 
-        path = self._file_queue[self._current_queue_index]
-        idx = self._current_queue_index + 1
-        total = len(self._file_queue)
-        filename = Path(path).name
+    def _start_file(self, index: int):
+        path = self._file_queue[index]
+        job = FileJob(path=path, index=index)
+        self._workers[path] = job
 
         # Highlight current file in list widget
-        self.file_list.setCurrentRow(self._current_queue_index)
+        self.file_list.setCurrentRow(index)
 
-        # Reset per-file scratch
-        self.hits.clear()
-        self.ranges.clear()
-        self._pending_hits.clear()
-        self._stderr_buf = ""
-        self._stdout_buf = ""
-        self.video_duration_s = None
-        self.video_fps = None
-        self._analysis_start_time = None
+        self._run_ffmpeg(job)
 
-        self.progress.setFormat(f"[{idx}/{total}] Probing {filename}...")
-        self._run_ffprobe(path)
+    def _is_live(self, job: FileJob) -> bool:
+        # Signals from processes of a cancelled run can still arrive
+        return self._workers.get(job.path) is job
 
     def _cancel(self):
         self._queue_active = False
-        if self.ffmpeg_proc:
-            self.ffmpeg_proc.kill()
-        if self.probe_proc:
-            self.probe_proc.kill()
+        for job in self._workers.values():
+            if job.ffmpeg_proc:
+                job.ffmpeg_proc.kill()
+        self._workers.clear()
         self.flush_timer.stop()
+        self.drain_timer.stop()
         self._set_running_ui(False)
 
-        completed = self._current_queue_index
+        completed = self._finished_count
         total = len(self._file_queue)
         self.progress.setFormat(f"Cancelled ({completed}/{total} files completed)")
 
@@ -796,298 +1217,314 @@ class BlackFrameDetectorV2(QMainWindow):
             self.amount_spin,
             self.group_ranges_checkbox,
             self.min_run_spin,
+            self.fast_mode_checkbox,
+            self.parallel_spin,
         ]:
             w.setEnabled(not running)
 
         self.min_run_spin.setEnabled((not running) and self.group_ranges_checkbox.isChecked())
 
-    # ---------------- ffprobe ----------------
-
-    def _run_ffprobe(self, path: str):
-        self.probe_proc = QProcess(self)
-        self.probe_proc.finished.connect(lambda code, status: self._on_ffprobe_finished(path, code, status))
-
-        args = [
-            "-v", "error",
-            "-select_streams", "v:0",
-            "-show_entries", "format=duration:stream=avg_frame_rate,r_frame_rate",
-            "-of", "json",
-            path,
-        ]
-        self.probe_proc.start(resolve_tool("ffprobe"), args)
-
-    def _on_ffprobe_finished(self, path: str, exit_code: int, _exit_status):
-        if not self.probe_proc:
-            return
-
-        out = bytes(self.probe_proc.readAllStandardOutput()).decode("utf-8", errors="replace").strip()
-        err = bytes(self.probe_proc.readAllStandardError()).decode("utf-8", errors="replace").strip()
-
-        if exit_code != 0 or not out:
-            # Change 4: Use consolidated failure helper
-            self._record_failure_and_advance(path, "FAILED - probe")
-            return
-
-        try:
-            data = json.loads(out)
-            duration = data.get("format", {}).get("duration", None)
-            self.video_duration_s = float(duration) if duration is not None else None
-            if self.video_duration_s:
-                self._total_video_duration_s += self.video_duration_s
-
-            stream = data["streams"][0]
-            rate = stream.get("avg_frame_rate") or stream.get("r_frame_rate") or "0/0"
-            num, den = rate.split("/")
-            self.video_fps = float(num) / float(den) if float(den) != 0 else None
-        except Exception:
-            # If metadata parse fails, still run analysis but show indeterminate progress
-            self.video_duration_s = None
-            self.video_fps = None
-
-        self._run_ffmpeg(path)
-
     # ---------------- ffmpeg ----------------
 
-    def _run_ffmpeg(self, path: str):
+    def _run_ffmpeg(self, job: FileJob):
         threshold = int(self.threshold_spin.value())
         amount = float(self.amount_spin.value())
 
         vf = f"format=yuv420p,blackframe=amount={amount}:threshold={threshold}"
+        if self.fast_mode_checkbox.isChecked():
+            # Fewer pixels per frame for blackframe to test; every frame is still analyzed
+            vf = f"{FAST_MODE_SCALE},{vf}"
 
-        idx = self._current_queue_index + 1
-        total = len(self._file_queue)
-        filename = Path(path).name
-
-        # Set determinate/indeterminate progress
-        if self.video_duration_s and self.video_duration_s > 0:
-            self._set_progress_determinate(True)
-            self.progress.setValue(0)
-        else:
-            self._set_progress_determinate(False)
+        # Share the cores between concurrent ffmpeg processes instead of
+        # letting each one spawn a decoder thread per core
+        pool_size = min(self._max_parallel, len(self._file_queue))
+        threads = max(1, (os.cpu_count() or 1) // pool_size)
 
         args = [
             "-hide_banner",
             "-nostats",
             "-nostdin",
             "-loglevel", "info",
-            "-i", path,
+            "-threads", str(threads),
+            "-i", job.path,
             "-an", "-sn", "-dn",
             "-vf", vf,
             "-progress", "pipe:1",  # progress key=val on stdout
             "-f", "null", "-",
         ]
 
-        self.ffmpeg_proc = QProcess(self)
-        self.ffmpeg_proc.readyReadStandardError.connect(self._on_ffmpeg_stderr_chunk)
-        self.ffmpeg_proc.readyReadStandardOutput.connect(self._on_ffmpeg_stdout_chunk)
-        self.ffmpeg_proc.finished.connect(lambda code, status: self._on_ffmpeg_finished(path, code, status))
+        # Output is read by drain_timer; QProcess keeps buffering it in between
+        job.ffmpeg_proc = QProcess(self)
+        job.ffmpeg_proc.finished.connect(lambda code, status: self._on_ffmpeg_finished(job, code, status))
 
-        self.progress.setFormat(f"[{idx}/{total}] Analyzing {filename}..." + (" %p%" if self.video_duration_s else ""))
+        job.stage = "Analyzing"
+        self._update_progress()
 
-        self.ffmpeg_proc.start(resolve_tool("ffmpeg"), args)
+        job.ffmpeg_proc.start(resolve_tool("ffmpeg"), args)
 
-        if not self.ffmpeg_proc.waitForStarted(3000):
+        if not job.ffmpeg_proc.waitForStarted(3000):
             # Change 4: Use consolidated failure helper
-            self._record_failure_and_advance(path, "FAILED - ffmpeg start")
+            self._record_failure_and_advance(job, "FAILED - ffmpeg start")
             return
 
-        # Track start time for ETA calculation
-        self._analysis_start_time = time.time()
-
-        # Begin UI batching
-        self.flush_timer.start()
+        # Begin output draining and UI batching
+        if not self.drain_timer.isActive():
+            self.drain_timer.start()
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
 
-    def _on_ffmpeg_stdout_chunk(self):
-        if not self.ffmpeg_proc:
+    def _on_ffmpeg_stdout_chunk(self, job: FileJob):
+        if not self._is_live(job):
             return
-        chunk = bytes(self.ffmpeg_proc.readAllStandardOutput()).decode("utf-8", errors="replace")
-        self._stdout_buf += chunk
-
-        lines, self._stdout_buf = self._split_complete_lines(self._stdout_buf)
+        # -progress output is ASCII key=value lines; match it as bytes, like stderr
+        job.stdout_buf += job.ffmpeg_proc.readAllStandardOutput().data()
+
+        lines = self._take_complete_lines(job.stdout_buf)
+        # A chunk can hold several progress blocks; only the newest one matters,
+        # so repaint the bar once per chunk instead of once per block.
+        # out_time_us is the unambiguous key (out_time_ms is also microseconds, despite its name)
+        out_time_us = None
+        finished = False
         for line in lines:
-            m = PROGRESS_OUT_TIME_MS_RE.match(line)
-            if m and self.video_duration_s and self.video_duration_s > 0:
-                # Note: despite the name, out_time_ms is actually in microseconds
-                out_time_us = int(m.group(1))
-                dur_us = int(self.video_duration_s * 1_000_000)
-                frac = max(0.0, min(1.0, out_time_us / dur_us))
-                self.progress.setValue(int(frac * 1000))
-
-                # Calculate and display ETA
-                self._update_progress_eta(frac)
-                continue
-
-            if PROGRESS_END_RE.match(line):
-                if self.video_duration_s and self.video_duration_s > 0:
-                    self.progress.setValue(1000)
-                    idx = self._current_queue_index + 1
-                    total = len(self._file_queue)
-                    # Change 10: derive path from queue instead of _last_path
-                    filename = Path(self._file_queue[self._current_queue_index]).name
-                    self.progress.setFormat(f"[{idx}/{total}] Finishing {filename}...")
-
-    def _update_progress_eta(self, frac: float):
-        """Update progress bar format with ETA countdown."""
-        if frac <= 0 or self._analysis_start_time is None:
+            if line.startswith(b"out_time_us="):
+                value = line[12:].strip()
+                if value.isdigit():  # "N/A" until the first timestamp
+                    out_time_us = int(value)
+            elif line.startswith(b"progress=end"):
+                finished = True
+
+        if finished:
+            job.frac = 1.0
+            job.stage = "Finishing"
+        elif out_time_us is not None and job.duration_s and job.duration_s > 0:
+            dur_us = int(job.duration_s * 1_000_000)
+            job.frac = max(0.0, min(1.0, out_time_us / dur_us))
+        else:
             return
+        self._update_progress()
 
-        elapsed = time.time() - self._analysis_start_time
-        if elapsed < 0.5:
-            # Not enough data yet for reliable ETA
+    def _update_progress(self):
+        """
+        Show queue-wide progress: finished files count as 1, running files
+        contribute their fractional progress.
+        """
+        if not self._workers:
+            return
+        # Progress arrives per job every ~0.5 s; repaint at most PROGRESS_UPDATE_HZ times a second
+        now = time.monotonic()
+        if now - self._last_progress_update < 1.0 / PROGRESS_UPDATE_HZ:
             return
+        self._last_progress_update = now
 
-        idx = self._current_queue_index + 1
         total = len(self._file_queue)
-        filename = Path(self._file_queue[self._current_queue_index]).name
+        frac = (self._finished_count + sum(j.frac for j in self._workers.values())) / total
 
-        # Estimate total time and remaining time
-        estimated_total = elapsed / frac
-        remaining = max(0, estimated_total - elapsed)
+        # Indeterminate only while nothing is measurable yet
+        determinate = self._finished_count > 0 or any(j.duration_s for j in self._workers.values())
+        if determinate != (self.progress.maximum() != 0):
+            self._set_progress_determinate(determinate)
+        if determinate:
+            self.progress.setValue(int(frac * 1000))
+
+        if len(self._workers) == 1:
+            job = next(iter(self._workers.values()))
+            label = f"[{job.index + 1}/{total}] {job.stage} {self._name_cache[job.path]}"
+        else:
+            label = f"[{self._finished_count}/{total} done] Analyzing {len(self._workers)} files"
+
+        eta_str = self._eta_text(frac, now)
+        if eta_str:
+            self.progress.setFormat(f"{label} — {int(frac * 100)}% — {eta_str}")
+        else:
+            self.progress.setFormat(f"{label}..." + (" %p%" if determinate else ""))
+
+    def _eta_text(self, frac: float, now: float) -> str:
+        """
+        ETA countdown for the whole queue, or "" while there is too little data.
+        Uses an exponentially weighted average of recent throughput, so a slow
+        start (ffmpeg spin-up, first file's banner) stops skewing the estimate.
+        """
+        if frac <= 0 or self._queue_start_time is None:
+            return ""
+
+        elapsed = now - self._queue_start_time
+        if elapsed < 0.5:
+            # Not enough data yet for reliable ETA
+            return ""
+
+        if self._eta_rate is None:
+            # Seed with the average rate so far
+            rate = frac / elapsed
+        else:
+            prev_time, prev_frac = self._eta_sample
+            dt = now - prev_time
+            rate = self._eta_rate
+            if dt > 0:
+                rate = (1 - ETA_SMOOTHING) * rate + ETA_SMOOTHING * (frac - prev_frac) / dt
+        self._eta_rate = rate
+        self._eta_sample = (now, frac)
+        if rate <= 0:
+            return ""
+        remaining = (1 - frac) / rate
 
         # Format remaining time as M:SS
         remaining_min = int(remaining // 60)
         remaining_sec = int(remaining % 60)
 
-        pct = int(frac * 100)
         if remaining_min > 0:
-            eta_str = f"{remaining_min}:{remaining_sec:02d} remaining"
-        else:
-            eta_str = f"{remaining_sec}s remaining"
+            return f"{remaining_min}:{remaining_sec:02d} remaining"
+        return f"{remaining_sec}s remaining"
 
-        self.progress.setFormat(f"[{idx}/{total}] {filename} — {pct}% — {eta_str}")
+    def _on_ffmpeg_stderr_chunk(self, job: FileJob):
+        if not self._is_live(job):
+            return
+        # Stay in bytes: ffmpeg's log output is ASCII, so decoding every chunk is wasted work
+        buf = job.stderr_buf
+        buf += job.ffmpeg_proc.readAllStandardError().data()
+        end = buf.rfind(b"\n")
+        if end < 0:
+            return
 
-    # Change 3: Extracted blackframe parsing into a helper
-    @staticmethod
-    def _parse_blackframe_line(line: str) -> Optional[BlackFrameHit]:
-        m = BLACKFRAME_LINE_RE.search(line)
-        if not m:
-            return None
-        frame = int(m.group("frame"))
-        pblack = float(m.group("pblack")) if m.group("pblack") else None
-        pts = int(m.group("pts")) if m.group("pts") else None
-        t = float(m.group("t")) if m.group("t") else None
-        return BlackFrameHit(frame=frame, time_s=t, pblack=pblack, pts=pts)
-
-    def _on_ffmpeg_stderr_chunk(self):
-        if not self.ffmpeg_proc:
+        # Take only the complete lines and drop them in place; the partial tail stays in the buffer
+        block = bytes(memoryview(buf)[:end])
+        del buf[:end + 1]
+        if not job.header_done:
+            self._scan_input_banner(job, block.split(b"\n"))
+        # Most chunks are banner/codec chatter: one C-level scan rejects them without a regex pass
+        if BLACKFRAME_MARKER not in block:
             return
-        chunk = bytes(self.ffmpeg_proc.readAllStandardError()).decode("utf-8", errors="replace")
-        self._stderr_buf += chunk
+        scan_blackframe_hits(block, job.hits)
+        job.runs.feed(job.hits)
 
-        lines, self._stderr_buf = self._split_complete_lines(self._stderr_buf)
+    def _scan_input_banner(self, job: FileJob, lines: List[bytes]):
+        """
+        Pick the duration up from ffmpeg's own input banner, which saves
+        spawning a separate ffprobe per file.
+        """
         for line in lines:
-            hit = self._parse_blackframe_line(line)
-            if hit:
-                self.hits.append(hit)
-                self._pending_hits.append(hit)
+            if line.lstrip().startswith(b"Duration:"):
+                job.header_done = True
+                job.duration_s = parse_duration_line(line)
+                if job.duration_s:
+                    self._total_video_duration_s += job.duration_s
+                    self._update_progress()
+                return
+
+    def _drain_ffmpeg_output(self):
+        """Read everything the running ffmpeg processes have written since the last tick."""
+        for job in list(self._workers.values()):
+            self._on_ffmpeg_stdout_chunk(job)
+            self._on_ffmpeg_stderr_chunk(job)
 
     @staticmethod
-    def _split_complete_lines(buf: str) -> Tuple[List[str], str]:
+    def _take_complete_lines(buf: bytearray) -> List[bytes]:
         """
-        Return (complete_lines, remainder) without losing partial lines.
+        Remove and return the complete lines from buf; a partial last line
+        stays in the buffer for the next read.
         """
-        if "\n" not in buf:
-            return [], buf
-        parts = buf.split("\n")
-        complete = parts[:-1]
-        remainder = parts[-1]
+        end = buf.rfind(b"\n")
+        if end < 0:
+            return []
+        block = bytes(memoryview(buf)[:end])
+        del buf[:end + 1]
         # Strip CR for Windows-ish line endings
-        complete = [line.rstrip("\r") for line in complete if line]
-        return complete, remainder
+        return [line.rstrip(b"\r") for line in block.split(b"\n") if line]
 
-    # Change 9: deque-based flush — O(1) per popleft
     def _flush_pending_hits(self):
         """
         Batch-insert pending hits to avoid UI lock-ups on large result sets.
+
+        The timer backs off while nothing arrives and speeds up while a
+        backlog is building, so quiet runs wake less and bursts drain sooner.
         """
-        if not self._pending_hits:
+        pending = 0
+        for job in self._workers.values():
+            pending += len(job.hits) - job.flushed
+            end = min(job.flushed + FLUSH_BATCH_SIZE, len(job.hits))
+            if end > job.flushed:
+                self.frames_model.append_hits(self._name_cache[job.path], job.hits, job.flushed, end)
+                job.flushed = end
+
+        interval = self.flush_timer.interval()
+        if pending == 0:
+            self.flush_timer.setInterval(min(FLUSH_INTERVAL_MAX_MS, interval * 2))
+        elif pending > FLUSH_BATCH_SIZE:
+            self.flush_timer.setInterval(max(FLUSH_INTERVAL_MIN_MS, interval // 2))
+
+    def _on_ffmpeg_finished(self, job: FileJob, exit_code: int, _exit_status):
+        if not self._is_live(job):
             return
 
-        batch: List[BlackFrameHit] = []
-        for _ in range(min(500, len(self._pending_hits))):
-            batch.append(self._pending_hits.popleft())
+        # Final drain: pick up whatever arrived since the last drain_timer tick
+        self._on_ffmpeg_stdout_chunk(job)
+        self._on_ffmpeg_stderr_chunk(job)
 
-        # Change 10: derive filename from queue
-        filename = Path(self._file_queue[self._current_queue_index]).name
-
-        table = self.frames_table
-        table.setUpdatesEnabled(False)
-        try:
-            start_row = table.rowCount()
-            table.setRowCount(start_row + len(batch))
-            for i, hit in enumerate(batch):
-                row = start_row + i
-                table.setItem(row, 0, QTableWidgetItem(filename))
-                table.setItem(row, 1, QTableWidgetItem(str(hit.frame)))
-                table.setItem(row, 2, QTableWidgetItem(seconds_to_hhmmssms(hit.time_s)))
-                pb_str = f"{hit.pblack:.2f}%" if hit.pblack is not None else "n/a"
-                table.setItem(row, 3, QTableWidgetItem(pb_str))
-        finally:
-            table.setUpdatesEnabled(True)
-
-    def _on_ffmpeg_finished(self, path: str, exit_code: int, _exit_status):
-        # Stop batch timer and flush any remaining hits
-        self.flush_timer.stop()
+        # Flush any remaining hits
         self._flush_pending_hits()
 
-        # Change 3: Use _parse_blackframe_line for remaining buffer
-        if self._stderr_buf:
-            tail_lines = [self._stderr_buf.rstrip("\r")]
-            self._stderr_buf = ""
-            for line in tail_lines:
-                hit = self._parse_blackframe_line(line)
-                if hit:
-                    self.hits.append(hit)
-                    self._pending_hits.append(hit)
+        # Parse whatever is left in the buffer
+        if job.stderr_buf:
+            scan_blackframe_hits(bytes(job.stderr_buf), job.hits)
+            job.stderr_buf = bytearray()
             self._flush_pending_hits()
 
         if exit_code != 0:
             # Change 4: Use consolidated failure helper
-            self._record_failure_and_advance(path, "FAILED")
+            self._record_failure_and_advance(job, "FAILED")
             return
 
-        # Success - sort and store results
-        self.hits.sort(key=lambda h: h.frame)
+        # Success - store results; runs were tracked while the hits arrived
+        path = job.path
+        job.runs.feed(job.hits)
+        if not job.runs.in_order:
+            job.hits.sort_by_frame()
 
-        if self.group_ranges_checkbox.isChecked():
-            self.ranges = build_ranges(self.hits, int(self.min_run_spin.value()))
+        if not self.group_ranges_checkbox.isChecked():
+            ranges = []
+        elif job.runs.in_order:
+            ranges = job.runs.ranges(job.hits, int(self.min_run_spin.value()))
         else:
-            self.ranges = []
+            ranges = build_ranges(job.hits, int(self.min_run_spin.value()))
 
         # Change 8: Swap references instead of copying
-        self.all_hits[path] = self.hits
-        self.all_ranges[path] = self.ranges
-        self.hits = []
-        self.ranges = []
+        self.all_hits[path] = job.hits
+        self.all_ranges[path] = ranges
+        self._total_frame_count += len(job.hits)
+        self._total_range_count += len(ranges)
 
         # Mark item with result count
-        item = self.file_list.item(self._current_queue_index)
+        item = self.file_list.item(job.index)
         count = len(self.all_hits[path])
         if item:
-            item.setText(f"{Path(path).name}  [{count} frame{'s' if count != 1 else ''}]")
+            item.setText(f"{self._name_cache[path]}  [{count} frame{'s' if count != 1 else ''}]")
 
         # Append per-file status line
         range_count = len(self.all_ranges[path])
-        line = f"{Path(path).name} — {count} frame{'s' if count != 1 else ''}"
+        line = f"{self._name_cache[path]} — {count} frame{'s' if count != 1 else ''}"
         if range_count > 0:
             line += f", {range_count} range{'s' if range_count != 1 else ''}"
         self._append_status_line(line)
 
-        self._current_queue_index += 1
-        if self._queue_active and self._current_queue_index < len(self._file_queue):
-            self._start_next_file()
-        else:
-            self._on_all_files_finished()
+        self._finish_job(job)
 
     # Change 4: Consolidated failure-and-advance helper
-    def _record_failure_and_advance(self, path: str, label: str):
-        self.all_hits[path] = []
-        self.all_ranges[path] = []
-        self._mark_list_item_failed(self._current_queue_index, label)
-        self._append_status_line(f"{Path(path).name} — {label}")
-        self._current_queue_index += 1
-        if self._queue_active:
-            self._start_next_file()
+    def _record_failure_and_advance(self, job: FileJob, label: str):
+        self.all_hits[job.path] = HitsBuffer()
+        self.all_ranges[job.path] = []
+        self._mark_list_item_failed(job.index, label)
+        self._append_status_line(f"{self._name_cache[job.path]} — {label}")
+        self._finish_job(job)
+
+    def _finish_job(self, job: FileJob):
+        """Retire a finished or failed job and hand its slot to the next queued file."""
+        del self._workers[job.path]
+        self._finished_count += 1
+        if job.ffmpeg_proc:
+            job.ffmpeg_proc.deleteLater()
+        if not self._workers:
+            self.flush_timer.stop()
+            self.drain_timer.stop()
+        self._fill_workers()
 
     def _mark_list_item_failed(self, index: int, label: str):
         item = self.file_list.item(index)
@@ -1118,8 +1555,8 @@ class BlackFrameDetectorV2(QMainWindow):
 
         # Summary
         total_files = len(self._file_queue)
-        total_frames = sum(len(h) for h in self.all_hits.values())
-        total_ranges = sum(len(r) for r in self.all_ranges.values())
+        total_frames = self._total_frame_count
+        total_ranges = self._total_range_count
 
         summary = f"Done -- {total_files} file{'s' if total_files != 1 else ''}, {total_frames} frame{'s' if total_frames != 1 else ''}"
         if total_ranges > 0:
@@ -1127,131 +1564,114 @@ class BlackFrameDetectorV2(QMainWindow):
         if self._total_video_duration_s > 0:
             summary += f" | Duration: {seconds_to_hhmmssms(self._total_video_duration_s)}"
         if self._queue_start_time is not None:
-            elapsed = time.time() - self._queue_start_time
+            elapsed = time.monotonic() - self._queue_start_time
             summary += f" | Processed in {seconds_to_hhmmssms(elapsed)}"
         self.progress.setFormat(summary)
         self._append_status_line(summary)
 
         self._finalize_exports_state()
 
-    # Change 7: Direct iteration without intermediate list
     def _render_all_frames_table(self):
-        self.frames_table.setRowCount(0)
-        total_rows = sum(len(self.all_hits.get(p, [])) for p in self._file_queue)
-        if total_rows == 0:
-            return
+        self.frames_model.set_files([
+            (self._name_cache[path], self.all_hits[path])
+            for path in self._file_queue
+            if path in self.all_hits
+        ])
 
-        table = self.frames_table
-        table.setUpdatesEnabled(False)
-        try:
-            table.setRowCount(total_rows)
-            row = 0
-            for path in self._file_queue:
-                filename = Path(path).name
-                for hit in self.all_hits.get(path, []):
-                    table.setItem(row, 0, QTableWidgetItem(filename))
-                    table.setItem(row, 1, QTableWidgetItem(str(hit.frame)))
-                    table.setItem(row, 2, QTableWidgetItem(seconds_to_hhmmssms(hit.time_s)))
-                    pb_str = f"{hit.pblack:.2f}%" if hit.pblack is not None else "n/a"
-                    table.setItem(row, 3, QTableWidgetItem(pb_str))
-                    row += 1
-        finally:
-            table.setUpdatesEnabled(True)
-
-    # Change 7: Direct iteration without intermediate list
     def _render_all_ranges_table(self):
-        self.ranges_table.setRowCount(0)
-        total_rows = sum(len(self.all_ranges.get(p, [])) for p in self._file_queue)
-        if total_rows == 0:
-            return
-
-        t = self.ranges_table
-        t.setUpdatesEnabled(False)
-        try:
-            t.setRowCount(total_rows)
-            row = 0
-            for path in self._file_queue:
-                filename = Path(path).name
-                for r in self.all_ranges.get(path, []):
-                    t.setItem(row, 0, QTableWidgetItem(filename))
-                    t.setItem(row, 1, QTableWidgetItem(str(r.start_frame)))
-                    t.setItem(row, 2, QTableWidgetItem(str(r.end_frame)))
-                    t.setItem(row, 3, QTableWidgetItem(seconds_to_hhmmssms(r.start_time_s)))
-                    t.setItem(row, 4, QTableWidgetItem(seconds_to_hhmmssms(r.end_time_s)))
-                    t.setItem(row, 5, QTableWidgetItem(str(r.length_frames)))
-                    if r.avg_pblack is not None and r.min_pblack is not None:
-                        s = f"{r.avg_pblack:.2f}% / {r.min_pblack:.2f}%"
-                    elif r.min_pblack is not None:
-                        s = f"n/a / {r.min_pblack:.2f}%"
-                    else:
-                        s = "n/a"
-                    t.setItem(row, 6, QTableWidgetItem(s))
-                    row += 1
-        finally:
-            t.setUpdatesEnabled(True)
+        self.ranges_model.set_rows([
+            (self._name_cache[path], r)
+            for path in self._file_queue
+            for r in self.all_ranges.get(path, [])
+        ])
 
     def _finalize_exports_state(self):
-        has_frames = any(len(h) > 0 for h in self.all_hits.values())
-        has_ranges = any(len(r) > 0 for r in self.all_ranges.values())
+        has_frames = self._total_frame_count > 0
+        has_ranges = self._total_range_count > 0
         self.export_frames_csv_btn.setEnabled(has_frames)
         self.export_frames_json_btn.setEnabled(has_frames)
         self.export_ranges_csv_btn.setEnabled(has_ranges)
         self.export_ranges_json_btn.setEnabled(has_ranges)
+        # No second submit while the same JSON export is still being written
+        for task in self._export_tasks:
+            task.button.setEnabled(False)
 
     # ---------------- Export ----------------
 
     def export_frames_csv(self):
-        has_frames = any(len(h) > 0 for h in self.all_hits.values())
-        if not has_frames:
+        if self._total_frame_count == 0:
             return
         path, _ = QFileDialog.getSaveFileName(self, "Export Frames CSV", "black_frames.csv", "CSV (*.csv)")
         if not path:
             return
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            w = csv.writer(f)
-            w.writerow(["file", "frame", "time_s", "timestamp", "pblack", "pts"])
+        # Rows are preformatted into one string per file; only the file name can need
+        # CSV quoting, so csv.writer handles that single cell and nothing else
+        with open(path, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+            f.write("file,frame,time_s,timestamp,pblack,pts\r\n")
             for fpath in self._file_queue:
-                filename = Path(fpath).name
-                for h in self.all_hits.get(fpath, []):
-                    w.writerow([
-                        filename,
-                        h.frame,
-                        h.time_s if h.time_s is not None else "",
-                        seconds_to_hhmmssms(h.time_s) if h.time_s is not None else "",
-                        f"{h.pblack:.6f}" if h.pblack is not None else "",
-                        h.pts if h.pts is not None else "",
-                    ])
+                hits = self.all_hits.get(fpath)
+                if hits:
+                    f.write("".join(self._frame_csv_lines(self._name_cache[fpath], hits)))
+
+    @staticmethod
+    def _frame_csv_lines(filename: str, hits: HitsBuffer):
+        """
+        CSV lines read straight from the HitsBuffer columns (NaN / NO_PTS become
+        empty cells), byte-identical to csv.writer's default dialect.
+        """
+        cell = io.StringIO()
+        csv.writer(cell).writerow([filename])
+        name = cell.getvalue()[:-2]  # quoted only if needed; drop the "\r\n"
+        isnan = math.isnan
+        for frame, t, p, pts in zip(hits.frame, hits.time_s, hits.pblack, hits.pts):
+            if isnan(t):
+                time_s = timestamp = ""
+            else:
+                time_s = t
+                timestamp = seconds_to_hhmmssms(t)
+            pblack = "" if isnan(p) else format(p, ".6f")
+            yield f"{name},{frame},{time_s},{timestamp},{pblack},{'' if pts == NO_PTS else pts}\r\n"
 
     def export_frames_json(self):
-        has_frames = any(len(h) > 0 for h in self.all_hits.values())
-        if not has_frames:
+        if self._total_frame_count == 0:
             return
         path, _ = QFileDialog.getSaveFileName(self, "Export Frames JSON", "black_frames.json", "JSON (*.json)")
         if not path:
             return
+        # Snapshot the per-file buffers; a new run replaces them rather than mutating them
+        files = [(self._name_cache[p], self.all_hits[p]) for p in self._file_queue if p in self.all_hits]
+        self._start_json_export(path, lambda: self._frames_json_payload(files), self.export_frames_json_btn)
+
+    @staticmethod
+    def _frames_json_payload(files: List[Tuple[str, HitsBuffer]]) -> list:
+        # Dicts built straight from the columns; keys follow BlackFrameHit's field order, then file/timestamp
         payload = []
-        for fpath in self._file_queue:
-            filename = Path(fpath).name
-            for h in self.all_hits.get(fpath, []):
-                d = asdict(h)
-                d["file"] = filename
-                d["timestamp"] = seconds_to_hhmmssms(h.time_s) if h.time_s is not None else None
-                payload.append(d)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        append = payload.append
+        isnan = math.isnan
+        for filename, hits in files:
+            for frame, t, p, pts in zip(hits.frame, hits.time_s, hits.pblack, hits.pts):
+                has_t = not isnan(t)
+                append({
+                    "frame": frame,
+                    "time_s": t if has_t else None,
+                    "pblack": None if isnan(p) else p,
+                    "pts": None if pts == NO_PTS else pts,
+                    "file": filename,
+                    "timestamp": seconds_to_hhmmssms(t) if has_t else None,
+                })
+        return payload
 
     def export_ranges_csv(self):
-        has_ranges = any(len(r) > 0 for r in self.all_ranges.values())
-        if not has_ranges:
+        if self._total_range_count == 0:
             return
         path, _ = QFileDialog.getSaveFileName(self, "Export Ranges CSV", "black_ranges.csv", "CSV (*.csv)")
         if not path:
             return
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
             w = csv.writer(f)
             w.writerow(["file", "start_frame", "end_frame", "start_timestamp", "end_timestamp", "length_frames", "avg_pblack", "min_pblack"])
             for fpath in self._file_queue:
-                filename = Path(fpath).name
+                filename = self._name_cache[fpath]
                 for r in self.all_ranges.get(fpath, []):
                     w.writerow([
                         filename,
@@ -1265,24 +1685,47 @@ class BlackFrameDetectorV2(QMainWindow):
                     ])
 
     def export_ranges_json(self):
-        has_ranges = any(len(r) > 0 for r in self.all_ranges.values())
-        if not has_ranges:
+        if self._total_range_count == 0:
             return
         path, _ = QFileDialog.getSaveFileName(self, "Export Ranges JSON", "black_ranges.json", "JSON (*.json)")
         if not path:
             return
-        payload = []
-        for fpath in self._file_queue:
-            filename = Path(fpath).name
-            for r in self.all_ranges.get(fpath, []):
-                d = asdict(r)
-                d["file"] = filename
-                d["start_timestamp"] = seconds_to_hhmmssms(r.start_time_s) if r.start_time_s is not None else None
-                d["end_timestamp"] = seconds_to_hhmmssms(r.end_time_s) if r.end_time_s is not None else None
-                payload.append(d)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+        files = [(self._name_cache[p], self.all_ranges[p]) for p in self._file_queue if p in self.all_ranges]
+        self._start_json_export(path, lambda: self._ranges_json_payload(files), self.export_ranges_json_btn)
 
+    @staticmethod
+    def _ranges_json_payload(files: List[Tuple[str, List[BlackRange]]]) -> list:
+        # Keys follow BlackRange's field order, then file and start/end timestamps
+        payload = []
+        for filename, ranges in files:
+            for r in ranges:
+                payload.append({
+                    "start_frame": r.start_frame,
+                    "end_frame": r.end_frame,
+                    "start_time_s": r.start_time_s,
+                    "end_time_s": r.end_time_s,
+                    "length_frames": r.length_frames,
+                    "avg_pblack": r.avg_pblack,
+                    "min_pblack": r.min_pblack,
+                    "file": filename,
+                    "start_timestamp": seconds_to_hhmmssms(r.start_time_s) if r.start_time_s is not None else None,
+                    "end_timestamp": seconds_to_hhmmssms(r.end_time_s) if r.end_time_s is not None else None,
+                })
+        return payload
+
+    def _start_json_export(self, path: str, build_payload: Callable[[], list], button: QPushButton):
+        task = JsonExportTask(path, build_payload, button)
+        task.signals.finished.connect(self._on_json_export_finished, Qt.QueuedConnection)
+        self._export_tasks.append(task)
+        button.setEnabled(False)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_json_export_finished(self, task: JsonExportTask, error: str):
+        self._export_tasks.remove(task)
+        if not self._running:
+            self._finalize_exports_state()
+        if error:
+            QMessageBox.warning(self, "Export Failed", f"Could not write {task.path}:\n{error}")
 
 def main():
     app = QApplication(sys.argv)